@@ -0,0 +1,8 @@
+from arxiv_slack.core import (  # noqa: F401
+    feed_to_post,
+    fetch_paper_feeds,
+    get_submitted_date_range,
+    latest_announced_date,
+    notify_slack,
+    run,
+)
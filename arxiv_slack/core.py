@@ -0,0 +1,381 @@
+import concurrent.futures
+import functools
+import logging
+import os
+import pickle
+import re
+import tempfile
+import time
+import datetime as dt
+
+import requests
+import tenacity
+
+UTC = dt.timezone.utc
+JST = dt.timezone(dt.timedelta(hours=9), "JST")
+EST = dt.timezone(dt.timedelta(hours=-5), "EST")
+
+_ARXIV_ID_RE = re.compile(r"^http://arxiv\.org/abs/(\d{4}\.\d{5})(?:v\d+)?$")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://", requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=8)
+)
+# arXiv's Atom XML compresses roughly 8x; _get_stream decompresses the
+# stream transparently via decode_content.
+_SESSION.headers["Accept-Encoding"] = "gzip"
+
+
+def _truncate_authors(authors: list, limit=2) -> list:
+    return authors if len(authors) <= limit else authors[:limit] + ["..."]
+
+
+def _arxiv_url_to_id(url: str) -> str:
+    return _ARXIV_ID_RE.match(url).group(1)
+
+
+def _primary_category_filter(category: str):
+    """
+    Returns a predicate checking whether a feed's primary category is
+    `category`. A trailing ".*" (e.g. "q-fin.*") matches any
+    subcategory, mirroring the wildcard accepted by the arXiv query.
+    """
+    if category.endswith(".*"):
+        prefix = category[:-1]  # keep the dot, e.g. "q-fin."
+        return lambda feed: feed["arxiv_primary_category"]["term"].startswith(prefix)
+    return lambda feed: feed["arxiv_primary_category"]["term"] == category
+
+
+@functools.lru_cache(maxsize=None)
+def latest_announced_date(now: dt.datetime) -> dt.datetime:
+    """
+    Ignores summer time
+
+    Examples
+    --------
+    >>> now = dt.datetime(2021, 1, 11, 8, 0, tzinfo=JST)
+    >>> latest_announced_date(now).astimezone(JST).isoformat()
+    '2021-01-08T10:00:00+09:00'
+
+    >>> now = dt.datetime(2021, 1, 12, 8, 0, tzinfo=JST)
+    >>> latest_announced_date(now).astimezone(JST).isoformat()
+    '2021-01-11T10:00:00+09:00'
+
+    >>> now = dt.datetime(2021, 1, 13, 8, 0, tzinfo=JST)
+    >>> latest_announced_date(now).astimezone(JST).isoformat()
+    '2021-01-12T10:00:00+09:00'
+
+    >>> now = dt.datetime(2021, 1, 14, 8, 0, tzinfo=JST)
+    >>> latest_announced_date(now).astimezone(JST).isoformat()
+    '2021-01-13T10:00:00+09:00'
+
+    >>> now = dt.datetime(2021, 1, 15, 8, 0, tzinfo=JST)
+    >>> latest_announced_date(now).astimezone(JST).isoformat()
+    '2021-01-14T10:00:00+09:00'
+    """
+    d = now.astimezone(EST)
+    if d.time() < dt.time(20, 0):
+        d -= dt.timedelta(days=1)
+    while d.isoweekday() in (5, 6):  # Fri or Sat -> Thu
+        d -= dt.timedelta(days=1)
+    return dt.datetime(d.year, d.month, d.day, 20, 0, tzinfo=EST)
+
+
+@functools.lru_cache(maxsize=None)
+def get_submitted_date_range(announced_date: dt.date) -> (dt.datetime, dt.datetime):
+    """
+    Get the submitted date ranges of the papers which are announced at
+    20:00 of `annouced_date` (EST).
+
+    cf.
+    https://arxiv.org/help/availability
+
+    Returns
+    -------
+    (submitted_date_begin, submitted_date_end)
+        submitted_date_begin: datetime.date
+        submitted_date_end: datetime.date
+
+    Examples
+    --------
+    >>> fmt = lambda b, e: (b.astimezone(EST).isoformat(), e.astimezone(EST).isoformat())
+
+    >>> b, e = get_submitted_date_range(dt.date(2021, 1, 12))
+    >>> fmt(b, e)
+    ('2021-01-11T14:00:00-05:00', '2021-01-12T13:59:59-05:00')
+
+    >>> b, e = get_submitted_date_range(dt.date(2021, 1, 13))
+    >>> fmt(b, e)
+    ('2021-01-12T14:00:00-05:00', '2021-01-13T13:59:59-05:00')
+
+    >>> b, e = get_submitted_date_range(dt.date(2021, 1, 14))
+    >>> fmt(b, e)
+    ('2021-01-13T14:00:00-05:00', '2021-01-14T13:59:59-05:00')
+
+    >>> b, e = get_submitted_date_range(dt.date(2021, 1, 17))
+    >>> fmt(b, e)
+    ('2021-01-16T14:00:00-05:00', '2021-01-17T13:59:59-05:00')
+
+    >>> b, e = get_submitted_date_range(dt.date(2021, 1, 18))
+    >>> fmt(b, e)
+    ('2021-01-15T14:00:00-05:00', '2021-01-18T13:59:59-05:00')
+    """
+    if announced_date.isoweekday() in (5, 6):
+        raise ValueError
+
+    if announced_date.isoweekday() != 1:
+        b = announced_date - dt.timedelta(1)
+        e = announced_date
+    else:
+        b = announced_date - dt.timedelta(3)
+        e = announced_date
+
+    datetime_b = dt.datetime(b.year, b.month, b.day, 14, 0, 0, tzinfo=EST)
+    datetime_e = dt.datetime(e.year, e.month, e.day, 13, 59, 59, tzinfo=EST)
+
+    return (datetime_b, datetime_e)
+
+
+_CACHE_TTL = 24 * 60 * 60  # arXiv metadata updates once per day
+
+_ARXIV_API_URL = "http://export.arxiv.org/api/query"
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ARXIV = "{http://arxiv.org/schemas/atom}"
+
+
+@tenacity.retry(
+    wait=tenacity.wait_random_exponential(multiplier=1, max=60),
+    stop=tenacity.stop_after_attempt(5),
+    retry=tenacity.retry_if_exception_type(requests.RequestException),
+)
+def _get_stream(url: str, params: dict):
+    """
+    GET `url` with retries and return the decoded streaming response.
+    """
+    response = _SESSION.get(url, params=params, stream=True, timeout=60)
+    response.raise_for_status()
+    response.raw.decode_content = True
+    return response
+
+
+def _query_arxiv(query: str, page_size: int = 100, max_results: int = 1000):
+    """
+    Query the arXiv API and yield one dict per Atom entry.
+
+    Entries are requested in pages of `page_size`, newest first, and
+    each page is parsed as it streams in. Iteration stops after a short
+    page, so a 20-paper day costs one small request instead of a
+    1000-entry one.
+
+    Parameters
+    ----------
+    query : str
+        arXiv API search query.
+    page_size : int
+        Number of entries to request per page.
+    max_results : int
+        Maximum total number of entries to request.
+
+    Yields
+    ------
+    feed : dict
+        Feed of an arXiv article with keys "arxiv_url", "title",
+        "authors", "published" and "arxiv_primary_category".
+    """
+    from lxml import etree  # deferred so --help and argparse errors stay fast
+
+    for start in range(0, max_results, page_size):
+        response = _get_stream(
+            _ARXIV_API_URL,
+            params={
+                "search_query": query,
+                "sortBy": "submittedDate",
+                "sortOrder": "descending",
+                "start": start,
+                "max_results": page_size,
+            },
+        )
+        n_entries = 0
+        for _, entry in etree.iterparse(response.raw, tag=f"{_ATOM}entry"):
+            n_entries += 1
+            yield {
+                "arxiv_url": entry.findtext(f"{_ATOM}id"),
+                "title": entry.findtext(f"{_ATOM}title"),
+                "authors": [
+                    author.findtext(f"{_ATOM}name")
+                    for author in entry.iterfind(f"{_ATOM}author")
+                ],
+                "published": dt.datetime.strptime(
+                    entry.findtext(f"{_ATOM}published"), "%Y-%m-%dT%H:%M:%SZ"
+                ).replace(tzinfo=UTC),
+                "arxiv_primary_category": {
+                    "term": entry.find(f"{_ARXIV}primary_category").get("term")
+                },
+            }
+            entry.clear()
+        if n_entries < page_size:
+            return
+
+
+def fetch_paper_feeds(category, from_datetime, to_datetime):
+    """
+    Fetch paper feeds in the specified category and date.
+
+    Feeds are yielded as they arrive from the API, so posting can start
+    before the whole response is parsed. Results are cached on disk for
+    a day keyed by category and date range, as requested by the arXiv
+    API operators; the cache is written once the stream is fully
+    consumed.
+
+    Parameters
+    ----------
+    category : str
+        Subject category to search.
+    from_datetime : datetime.datetime
+    to_datetime : datetime.datetime
+
+    Yields
+    ------
+    feed : dict
+        Feed of an arXiv article with keys "arxiv_url", "title",
+        "authors" and "arxiv_primary_category".
+    """
+    b, e = from_datetime.strftime("%Y%m%d%H%M%S"), to_datetime.strftime("%Y%m%d%H%M%S")
+    cache_path = os.path.join(tempfile.gettempdir(), f"arxiv_{category}_{b}_{e}.pkl")
+    if (
+        os.path.exists(cache_path)
+        and os.path.getmtime(cache_path) > time.time() - _CACHE_TTL
+    ):
+        logging.info("Cache hit: %s", cache_path)
+        with open(cache_path, "rb") as f:
+            yield from pickle.load(f)
+        return
+
+    query = f"cat:{category} AND submittedDate:[{b} TO {e}]"
+    logging.info("arXiv query: %s", query)
+
+    # Remove cross-lists
+    is_primary = _primary_category_filter(category)
+    # The API reads the naive digits of `b` as GMT, so the stop bound
+    # must be that same instant, not the EST-aware from_datetime.
+    window_begin = dt.datetime.strptime(b, "%Y%m%d%H%M%S").replace(tzinfo=UTC)
+    feeds = []
+    for feed in _query_arxiv(query):
+        if feed["published"] < window_begin:
+            break  # sorted newest first; the rest is outside the window
+        if is_primary(feed):
+            feeds.append(feed)
+            yield feed
+    # Don't cache an empty day: the API intermittently returns zero
+    # entries with HTTP 200, and a re-run should query again.
+    if feeds:
+        with open(cache_path, "wb") as f:
+            pickle.dump(feeds, f)
+
+
+def feed_to_post(feed) -> str:
+    """
+    Returns Slack post to describe the given paper feed.
+
+    Parameters
+    ----------
+    - feed : dict
+        Feed of an arXiv article.
+
+    Returns
+    -------
+    post : str
+        Slack post.
+    """
+    url = feed["arxiv_url"]
+    identifier = _arxiv_url_to_id(url)
+    title = _WHITESPACE_RE.sub(" ", feed["title"]).strip()
+    authors = ", ".join(_truncate_authors(feed["authors"], 2))
+    return f"[<{url}|{identifier}>] {title} ({authors})"
+
+
+def notify_slack(text: str, url: str) -> str:
+    """
+    Post the given text to the Slack incoming webhook.
+
+    The module-level session keeps the TCP/TLS connection alive across
+    posts, so only the first post pays for the handshake.
+
+    Parameters
+    ----------
+    text : str
+        Message to post.
+    url : str
+        Slack incoming webhook URL.
+
+    Returns
+    -------
+    response : str
+        Response body from Slack (normally "ok").
+    """
+    response = _SESSION.post(url, json={"text": text}, timeout=10)
+    return response.text
+
+
+def run(categories: list, posted_date: dt.datetime, webhook: str = None):
+    """
+    Fetch the latest announcements for each category and post them.
+
+    Parameters
+    ----------
+    categories : list[str]
+        Subject categories to search.
+    posted_date : datetime.datetime
+        Time the run is anchored to, normally now (UTC).
+    webhook : str, optional
+        Slack incoming webhook URL. When omitted, posts are only
+        logged.
+    """
+    announced_date = latest_announced_date(posted_date)
+    from_datetime, to_datetime = get_submitted_date_range(announced_date)
+
+    # Convert each datetime once; %-style formatting below is lazy, so
+    # nothing is rendered when INFO logging is disabled.
+    announced_jst = announced_date.astimezone(JST)
+    logging.info("Posted datetime: %s", posted_date.astimezone(UTC))
+    logging.info("Posted datetime: %s", posted_date.astimezone(JST))
+    logging.info("Announced datetime: %s", announced_date.astimezone(UTC))
+    logging.info("Announced datetime: %s", announced_jst)
+    logging.info(
+        "Submitted datetime: %s-%s",
+        from_datetime.astimezone(UTC),
+        to_datetime.astimezone(UTC),
+    )
+    logging.info(
+        "Submitted datetime: %s-%s",
+        from_datetime.astimezone(JST),
+        to_datetime.astimezone(JST),
+    )
+
+    header = f"New submissions for {announced_jst.date().isoformat()}"
+    # Fetch all categories concurrently; each query is seconds of I/O.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+        feeds_per_category = executor.map(
+            lambda category: list(
+                fetch_paper_feeds(category, from_datetime, to_datetime)
+            ),
+            categories,
+        )
+        posts = [feed_to_post(feed) for feeds in feeds_per_category for feed in feeds]
+    for post in [header] + posts:
+        logging.info("Post: %s", post)
+
+    if webhook is not None:
+
+        def notify(text):
+            response = notify_slack(text, webhook)
+            logging.info("Response: %s", response)
+            time.sleep(1.1)  # Slack webhooks accept about one message per second
+
+        # Batch papers so a day's feed costs a few webhook round-trips
+        # instead of one per paper; post sequentially so the channel
+        # order matches the feed order and the sleep actually paces us.
+        chunks = ["\n".join(posts[i : i + 20]) for i in range(0, len(posts), 20)]
+        for text in [header] + chunks:
+            notify(text)